@@ -0,0 +1,170 @@
+import gc
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from openpyxl import load_workbook
+
+
+def iter_roster_chunks(path, chunk_size=500):
+    """Yield the roster as lists of row dicts without loading the whole sheet.
+
+    The workbook is opened in openpyxl's read-only mode, so only the rows of
+    the current chunk are materialised at any time.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(name).strip() if name is not None else ""
+                   for name in header]
+
+        chunk = []
+        for values in rows:
+            if all(value is None for value in values):
+                continue
+            chunk.append(dict(zip(columns, values)))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def current_rss_mb():
+    """Return the current resident set size of this process in MiB.
+
+    Uses /proc on Linux and psutil elsewhere when it is installed. Returns
+    None when neither is available; peak RSS (getrusage) is deliberately not
+    used because it never drops and would keep the pipeline throttled.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+class RssGovernor:
+    """Bounds the number of students in flight and throttles on memory pressure.
+
+    acquire() blocks while the in-flight limit is reached, which applies
+    backpressure to the roster reader. When a max RSS is set and exceeded,
+    the limit is halved (down to one student at a time); it grows back by
+    one per completed student once RSS is under the ceiling again.
+    """
+
+    def __init__(self, max_in_flight, max_rss_mb=None):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_rss_mb = max_rss_mb
+        if max_rss_mb and current_rss_mb() is None:
+            print("Warning: current RSS is not measurable on this platform "
+                  "(no /proc, psutil not installed); --max-rss-mb is ignored")
+            self.max_rss_mb = None
+        self.limit = self.max_in_flight
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def _adjust_limit(self):
+        if not self.max_rss_mb:
+            return
+        if current_rss_mb() > self.max_rss_mb:
+            gc.collect()
+            if current_rss_mb() > self.max_rss_mb:
+                self.limit = max(1, self.limit // 2)
+                return
+        if self.limit < self.max_in_flight:
+            self.limit += 1
+
+    def acquire(self):
+        with self._cond:
+            self._adjust_limit()
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._adjust_limit()
+            self._cond.notify_all()
+
+
+class _ReorderBuffer:
+    """Hands completed rows to the writer in roster order.
+
+    Rows finishing early wait here until every earlier row has been
+    written. A row's governor slot is only released once it is written, so
+    the buffer never holds more than max_in_flight results. The first
+    writer error is kept in `error`; later rows are then dropped, since the
+    output is incomplete anyway.
+    """
+
+    def __init__(self, writer, governor):
+        self.writer = writer
+        self.governor = governor
+        self.error = None
+        self._pending = {}
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    def complete(self, index, result):
+        """Record row `index`'s (roll_no, profile), or None if it failed."""
+        with self._lock:
+            self._pending[index] = result
+            while self._next_index in self._pending:
+                result = self._pending.pop(self._next_index)
+                self._next_index += 1
+                try:
+                    if result is not None and self.error is None:
+                        self.writer.write(*result)
+                except Exception as e:
+                    self.error = e
+                finally:
+                    self.governor.release()
+
+
+def run_bounded(roster_chunks, process_row, writer, max_in_flight=8,
+                max_rss_mb=None):
+    """Scrape roster rows with bounded concurrency and stream results out.
+
+    process_row(row) must return (roll_no, profile). Results are written in
+    roster order, like the default mode, and are not retained afterwards.
+    If the writer fails, no further rows are started and the error is
+    re-raised here, before the caller closes (and publishes) the output.
+    """
+    governor = RssGovernor(max_in_flight, max_rss_mb)
+    reorder = _ReorderBuffer(writer, governor)
+
+    def task(index, row):
+        result = None
+        try:
+            result = process_row(row)
+        except Exception as e:
+            print(f"Error processing roster row: {str(e)}")
+            print(traceback.format_exc())
+        finally:
+            reorder.complete(index, result)
+
+    rows = (row for chunk in roster_chunks for row in chunk)
+    with ThreadPoolExecutor(max_workers=governor.max_in_flight) as executor:
+        for index, row in enumerate(rows):
+            governor.acquire()
+            if reorder.error is not None:
+                governor.release()
+                break
+            executor.submit(task, index, row)
+
+    if reorder.error is not None:
+        raise reorder.error
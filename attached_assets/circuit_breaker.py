@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class PlatformUnavailableError(Exception):
+    """A platform failed at the network level (connection error, timeout, 5xx, 429)."""
+
+    def __init__(self, platform, reason):
+        super().__init__(f"{platform} unavailable: {reason}")
+        self.platform = platform
+        self.reason = reason
+
+
+class CircuitOpenError(PlatformUnavailableError):
+    """A fetch was short-circuited because the platform's breaker is open."""
+
+    def __init__(self, platform):
+        super().__init__(platform, "circuit open")
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for one platform.
+
+    The breaker tracks the outcome of the last `window` requests. Once at
+    least `min_calls` have been seen and the failure rate reaches
+    `failure_rate`, it opens and every fetch is short-circuited. After
+    `cooldown` seconds a single probe request is let through (half-open);
+    its outcome closes or re-opens the breaker. Outcomes of requests that
+    were admitted before the breaker opened and finish while it is open or
+    half-open are ignored, so only the probe changes the state.
+    """
+
+    def __init__(self, platform, failure_rate=0.5, min_calls=5, window=20,
+                 cooldown=60.0):
+        self.platform = platform
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.short_circuited = 0
+        self.times_opened = 0
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return the state a request is admitted in, or None if it is not.
+
+        The returned value is passed back to record_success/record_failure;
+        HALF_OPEN marks the probe.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return CLOSED
+            if (self.state == OPEN and not self._probe_in_flight and
+                    time.monotonic() - self._opened_at >= self.cooldown):
+                self.state = HALF_OPEN
+                self._probe_in_flight = True
+                return HALF_OPEN
+            self.short_circuited += 1
+            return None
+
+    def record_success(self, admitted=CLOSED):
+        with self._lock:
+            if admitted == HALF_OPEN:
+                self._probe_in_flight = False
+                self.state = CLOSED
+                self._outcomes.clear()
+            elif self.state != CLOSED:
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self, admitted=CLOSED):
+        with self._lock:
+            if admitted == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open()
+                return
+            if self.state != CLOSED:
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_rate):
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self.times_opened += 1
+        self._opened_at = time.monotonic()
+
+
+BREAKER_SETTINGS = {}
+BREAKERS = {}
+_breakers_lock = threading.Lock()
+
+
+def configure_breakers(**settings):
+    """Set the CircuitBreaker keyword arguments used for every platform."""
+    with _breakers_lock:
+        BREAKER_SETTINGS.update(settings)
+        BREAKERS.clear()
+
+
+def get_breaker(platform):
+    """Return the shared breaker for a platform, creating it on first use."""
+    with _breakers_lock:
+        breaker = BREAKERS.get(platform)
+        if breaker is None:
+            breaker = CircuitBreaker(platform, **BREAKER_SETTINGS)
+            BREAKERS[platform] = breaker
+        return breaker
+
+
+def breaker_report():
+    """Summarise breakers that tripped during the run."""
+    with _breakers_lock:
+        return {
+            platform: {
+                "state": breaker.state,
+                "times_opened": breaker.times_opened,
+                "short_circuited": breaker.short_circuited
+            }
+            for platform, breaker in BREAKERS.items() if breaker.times_opened
+        }
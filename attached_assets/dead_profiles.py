@@ -0,0 +1,105 @@
+import csv
+import json
+import os
+import threading
+import time
+
+from profile_identity import PLATFORM_URL_RULES, canonical_profile
+
+
+def validate_profile_url(platform, url):
+    """Return None if the URL is a profile on the platform, else a reason.
+
+    A URL is valid iff canonical_profile() resolves it to this platform, so
+    validation and canonicalisation can never disagree.
+    """
+    if platform not in PLATFORM_URL_RULES:
+        return None
+    identity = canonical_profile(str(url))
+    if identity is None or identity.platform != platform:
+        return f"Malformed {platform} profile URL"
+    return None
+
+
+class DeadProfileIndex:
+    """Persistent negative-result index keyed by (platform, username).
+
+    Entries expire after `ttl_days`, so a handle that is created later is
+    picked up again without manual cleanup.
+    """
+
+    def __init__(self, path, ttl_days=7):
+        self.path = path
+        self.ttl = ttl_days * 24 * 60 * 60
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(platform, username):
+        return f"{platform}:{str(username).lower()}"
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        self._entries = {
+            key: entry
+            for key, entry in entries.items()
+            if now - entry.get("checked_at", 0) < self.ttl
+        }
+
+    def lookup(self, platform, username):
+        """Return the reason a profile is known dead, or None."""
+        with self._lock:
+            entry = self._entries.get(self._key(platform, username))
+        if entry is None or time.time() - entry["checked_at"] >= self.ttl:
+            return None
+        return entry["reason"]
+
+    def mark_dead(self, platform, username, reason):
+        with self._lock:
+            self._entries[self._key(platform, username)] = {
+                "reason": reason,
+                "checked_at": time.time()
+            }
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+class InvalidProfileReport:
+    """Collects malformed and non-existent profiles for admins to fix."""
+
+    FIELDS = ("Roll Number", "Platform", "URL", "Reason")
+
+    def __init__(self):
+        self._rows = []
+        self._lock = threading.Lock()
+
+    def add(self, roll_no, platform, url, reason):
+        with self._lock:
+            self._rows.append((roll_no, platform, url, reason))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def write_csv(self, path):
+        with self._lock:
+            rows = sorted(self._rows, key=lambda row: (str(row[0]), row[1]))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.FIELDS)
+            writer.writerows(rows)
@@ -0,0 +1,112 @@
+import json
+import re
+
+# Public JSON endpoints that back the HackerRank profile page.
+HACKERRANK_BADGES_API = "https://www.hackerrank.com/rest/hackers/{username}/badges"
+HACKERRANK_CERTIFICATES_API = (
+    "https://www.hackerrank.com/community/v1/test_results/hacker_certificate"
+    "?username={username}")
+
+_SCRIPT_PATTERNS = {}
+
+GFG_DIFFICULTIES = ("School", "Basic", "Easy", "Medium", "Hard")
+
+
+def _script_pattern(script_id):
+    pattern = _SCRIPT_PATTERNS.get(script_id)
+    if pattern is None:
+        pattern = re.compile(
+            r'<script[^>]*\bid=["\']%s["\'][^>]*>(.*?)</script>' %
+            re.escape(script_id), re.DOTALL | re.IGNORECASE)
+        _SCRIPT_PATTERNS[script_id] = pattern
+    return pattern
+
+
+def find_script_json(html, script_id="__NEXT_DATA__"):
+    """Decode the JSON payload of a <script id=...> tag without building a DOM."""
+    if not html:
+        return None
+    match = _script_pattern(script_id).search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def _count(value):
+    if isinstance(value, (dict, list)):
+        return len(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def gfg_fields_from_next_data(data):
+    """Pull username, coding score and per-difficulty counts from GFG's __NEXT_DATA__.
+
+    Returns None when the payload does not look like a GFG profile, so the
+    caller can fall back to the DOM extractor.
+    """
+    try:
+        page_props = data["props"]["pageProps"]
+    except (KeyError, TypeError):
+        return None
+    if not isinstance(page_props, dict):
+        return None
+
+    user_info = page_props.get("userInfo")
+    if not isinstance(user_info, dict):
+        return None
+    username = user_info.get("userName") or user_info.get("handle")
+    submissions = page_props.get("userSubmissionsInfo")
+    if not username or not isinstance(submissions, dict):
+        return None
+
+    counts = {}
+    for key, value in submissions.items():
+        for difficulty in GFG_DIFFICULTIES:
+            if key.lower() == difficulty.lower():
+                counts[difficulty] = _count(value)
+
+    coding_score = user_info.get("score")
+    return {
+        "Username": str(username).strip(),
+        "Coding_Score": str(coding_score) if coding_score is not None else "N/A",
+        "Counts": {d: counts.get(d, 0) for d in GFG_DIFFICULTIES},
+    }
+
+
+def hackerrank_badges_from_api(payload):
+    """Convert the badges endpoint payload to [{"name", "stars"}, ...].
+
+    The endpoint also lists badges without any stars, which the profile
+    page does not show; those are dropped so both paths agree.
+    """
+    models = payload.get("models") if isinstance(payload, dict) else None
+    if not isinstance(models, list):
+        return None
+    badges = [{
+        "name": model.get("badge_name") or "Unknown Badge",
+        "stars": _count(model.get("stars"))
+    } for model in models if isinstance(model, dict)]
+    return [badge for badge in badges if badge["stars"] > 0]
+
+
+def hackerrank_certificates_from_api(payload):
+    """Convert the certificates endpoint payload to the profile page's headings."""
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, list):
+        return None
+    certifications = []
+    for entry in data:
+        attributes = (entry or {}).get("attributes") or {}
+        if attributes.get("status") not in (None, "test_passed"):
+            continue
+        certificate = attributes.get("certificate") or {}
+        label = certificate.get("label") or attributes.get("certificate_name")
+        if label:
+            certifications.append(f"Certificate: {label}")
+    return certifications
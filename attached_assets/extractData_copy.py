@@ -1,46 +1,201 @@
+import argparse
 import requests
 import json
 import pandas as pd
 from bs4 import BeautifulSoup
 import threading
 import traceback
-import sys
 
-def get_hackerrank_profile(url):
-    if not url or pd.isna(url) or url.strip() == "":
-        return {"Total_Score": 0}
+from bounded_pipeline import iter_roster_chunks, run_bounded
+from circuit_breaker import (CircuitOpenError, PlatformUnavailableError,
+                             breaker_report, configure_breakers, get_breaker)
+from dead_profiles import (DeadProfileIndex, InvalidProfileReport,
+                           validate_profile_url)
+from embedded_json import (GFG_DIFFICULTIES, HACKERRANK_BADGES_API,
+                           HACKERRANK_CERTIFICATES_API, find_script_json,
+                           gfg_fields_from_next_data,
+                           hackerrank_badges_from_api,
+                           hackerrank_certificates_from_api)
+from extractors import get_parse_plan, schema_drift_report
+from last_good_store import LastGoodStore, is_good_profile
+from loadtest import CassetteRecorder, replay_request
+from output_formats import (OUTPUT_FORMATS, default_output_path, open_writer,
+                            read_profiles)
+from profile_identity import ProfileResultCache, canonical_profile
+
+# "auto" decodes the JSON embedded in pages we fetch anyway (GFG) and falls
+# back to the DOM extractors; "api" additionally reads HackerRank from its
+# public JSON endpoints (two requests instead of one page, so opt-in until
+# `loadtest.py verify-hackerrank` confirms both paths agree); "dom" always
+# builds the soup.
+EXTRACTION_MODE = "auto"
+
+# Per-student last known good values, used when a platform is unavailable.
+# LAST_GOOD persists across rosters and is opened in main(); the previous
+# run's results file is imported into it the first time it is needed.
+LAST_GOOD = None
+PREVIOUS_RESULTS_PATH = "students_profiles.json"
+_previous_imported = False
+_previous_lock = threading.Lock()
+
+# Negative-result index of profiles known not to exist, and the report of
+# skipped/dead profiles for admins. Replaced in main() from the CLI options.
+DEAD_PROFILES = DeadProfileIndex("dead_profiles.json")
+INVALID_PROFILES = InvalidProfileReport()
+
+# Scraper results keyed by canonical profile identity: concurrent fetches of
+# the same profile are shared, and only a small LRU of results is retained.
+PROFILE_RESULTS = ProfileResultCache()
+
+# Load-testing hooks (see loadtest.py): record live responses to cassettes,
+# or send every request to a replay server instead of the live sites.
+RECORDER = None
+REPLAY_URL = None
+
+
+def platform_request(platform, method, url, profile_username=None,
+                     **kwargs):
+    """Send a request through the platform's circuit breaker.
+
+    Raises CircuitOpenError without touching the network while the breaker
+    is open, and PlatformUnavailableError for connection errors, timeouts,
+    5xx and 429 responses. Anything else counts as the site being up; a 404
+    for a profile_username records it in the dead-profile index.
+    """
+    breaker = get_breaker(platform)
+    admitted = breaker.allow()
+    if admitted is None:
+        raise CircuitOpenError(platform)
+    # Any exception counts as a failure, so a probe can never leave the
+    # breaker stuck half-open.
+    succeeded = False
+    try:
+        if REPLAY_URL:
+            response = replay_request(REPLAY_URL, platform, method, url,
+                                      **kwargs)
+        else:
+            response = requests.request(method, url, **kwargs)
+            if RECORDER is not None:
+                RECORDER.record(platform, method, url, kwargs.get("json"),
+                                response)
+        if response.status_code >= 500 or response.status_code == 429:
+            raise PlatformUnavailableError(platform,
+                                           f"HTTP {response.status_code}")
+        succeeded = True
+    except requests.exceptions.RequestException as e:
+        raise PlatformUnavailableError(platform, type(e).__name__)
+    finally:
+        if succeeded:
+            breaker.record_success(admitted)
+        else:
+            breaker.record_failure(admitted)
+    if response.status_code == 404 and profile_username:
+        DEAD_PROFILES.mark_dead(platform, profile_username, "HTTP 404")
+    return response
 
-    headers = {"User-Agent": "Mozilla/5.0"}
 
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
+def _import_previous_results():
+    """Seed LAST_GOOD from the previous results file, once per run.
 
-        if response.status_code != 200:
-            return {"error": "Invalid URL", "Total_Score": 0}
+    Only runs the first time a platform is unavailable, so healthy runs
+    never pay for reading the file, and the parsed file is dropped as soon
+    as it is imported rather than kept in memory for the rest of the run.
+    """
+    global _previous_imported
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    with _previous_lock:
+        if _previous_imported:
+            return
+        _previous_imported = True
+        try:
+            profiles = read_profiles(PREVIOUS_RESULTS_PATH)
+        except (OSError, ValueError, AttributeError):
+            profiles = {}
+        if not profiles:
+            print(f"Warning: no readable previous results in "
+                  f"{PREVIOUS_RESULTS_PATH}; unavailable platforms fall "
+                  f"back to the last known good store only")
+            return
+        LAST_GOOD.import_profiles(profiles)
+
+
+def previous_profile(roll_no, platform):
+    """Return the last known good result for a student's platform, if any."""
+    if LAST_GOOD is None:
+        return None
+    _import_previous_results()
+    return LAST_GOOD.get(roll_no, platform)
+
+
+def _fetch_hackerrank_api(username, headers):
+    """Fetch HackerRank badges and certificates from the public JSON endpoints.
 
-        badges = []
-        total_score = 0
+    Returns None when either endpoint is unavailable or its payload has an
+    unexpected shape, so the caller can fall back to scraping the profile page.
+    A 404 here is not a dead profile: only the profile page decides that.
+    """
+    if not username or username == "N/A":
+        return None
+    try:
+        badges_response = platform_request(
+            "HackerRank",
+            "GET",
+            HACKERRANK_BADGES_API.format(username=username),
+            headers=headers,
+            timeout=10)
+        if badges_response.status_code != 200:
+            return None
+        badges = hackerrank_badges_from_api(badges_response.json())
+
+        certificates_response = platform_request(
+            "HackerRank",
+            "GET",
+            HACKERRANK_CERTIFICATES_API.format(username=username),
+            headers=headers,
+            timeout=10)
+        if certificates_response.status_code != 200:
+            return None
+        certifications = hackerrank_certificates_from_api(
+            certificates_response.json())
+    except (requests.exceptions.RequestException, ValueError):
+        return None
 
-        badge_containers = soup.find_all('svg', class_="hexagon")
+    if badges is None or certifications is None:
+        return None
+    return {"Badges": badges, "Certifications": certifications}
 
-        for container in badge_containers:
-            badge_name_tag = container.find('text', class_="badge-title")
-            badge_name = badge_name_tag.text.strip(
-            ) if badge_name_tag else "Unknown Badge"
 
-            star_section = container.find('g', class_="star-section")
-            star_count = len(star_section.find_all(
-                'svg', class_="badge-star")) if star_section else 0
+def get_hackerrank_profile(url):
+    if not url or pd.isna(url) or url.strip() == "":
+        return {"Total_Score": 0}
 
-            total_score += star_count
-            badges.append({'name': badge_name, 'stars': star_count})
+    headers = {"User-Agent": "Mozilla/5.0"}
 
-        certifications = [
-            cert.text.strip()
-            for cert in soup.find_all('h2', class_="certificate_v3-heading")
-        ]
+    try:
+        fields = None
+        if EXTRACTION_MODE == "api":
+            fields = _fetch_hackerrank_api(extract_username(url), headers)
+
+        if fields is None:
+            response = platform_request("HackerRank",
+                                        "GET",
+                                        url,
+                                        profile_username=extract_username(url),
+                                        headers=headers,
+                                        timeout=10)
+
+            if response.status_code != 200:
+                return {"error": "Invalid URL", "Total_Score": 0}
+
+            soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                fields = get_parse_plan("HackerRank").extract(soup)
+            finally:
+                soup.decompose()
+
+        badges = fields["Badges"]
+        certifications = fields["Certifications"]
+        total_score = sum(badge["stars"] for badge in badges)
 
         if not badges and not certifications:
             return {
@@ -62,6 +217,9 @@ def get_hackerrank_profile(url):
             "Total_Score": total_score
         }
 
+    except PlatformUnavailableError:
+        raise
+
     except requests.exceptions.RequestException:
         return {"error": "Invalid URL", "Total_Score": 0}
 
@@ -86,20 +244,29 @@ def scrape_codechef_profile(url):
 
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        response = requests.get(url, headers=headers)
+        response = platform_request("CodeChef",
+                                    "GET",
+                                    url,
+                                    profile_username=extract_username(url),
+                                    headers=headers,
+                                    timeout=10)
 
         if response.status_code != 200:
             return {"error": "Failed to fetch profile", "Total_Score": 0}
 
         soup = BeautifulSoup(response.text, 'html.parser')
         try:
-            username = soup.find("span",
-                                 class_="m-username--link").text.strip()
-            star = soup.find("span", class_="rating").text.strip()
-            rating = soup.find("div", class_="rating-number").text.strip()
-            contests_participated = int(
-                soup.find("div", class_="contest-participated-count").find(
-                    "b").text.strip())
+            try:
+                fields = get_parse_plan("CodeChef").extract(soup)
+            finally:
+                soup.decompose()
+            if any(value is None for value in fields.values()):
+                raise AttributeError("CodeChef profile details not found")
+
+            username = fields["Username"]
+            star = fields["Star"]
+            rating = fields["Rating"]
+            contests_participated = fields["Contests_Participated"]
 
             total_score = contests_participated * 2
 
@@ -123,14 +290,20 @@ def scrape_codechef_profile(url):
                 },
                 "Total_Score": 0
             }
+    except PlatformUnavailableError:
+        raise
     except Exception:
         return {"error": "Failed to fetch profile", "Total_Score": 0}
 
 
-def is_url_accessible(url):
+def is_url_accessible(url, platform="GeeksForGeeks"):
     """Check if the given URL is accessible and return the response object."""
     try:
-        response = requests.get(url, timeout=10)
+        response = platform_request(platform,
+                                    "GET",
+                                    url,
+                                    profile_username=extract_username(url),
+                                    timeout=10)
         if response.status_code == 200:
             return response
     except requests.exceptions.RequestException:
@@ -138,6 +311,35 @@ def is_url_accessible(url):
     return None
 
 
+def _gfg_fields_from_dom(soup):
+    """Extract GFG username, coding score and problem counts from the DOM."""
+    fields = get_parse_plan("GeeksForGeeks").extract(soup)
+
+    # Extract username
+    username = fields["Username"]
+    if not username:
+        raise ValueError("Username not found in profile")
+
+    # Extract coding score
+    scores = fields["Scores"]
+    coding_score = scores[0] if len(scores) > 0 else "N/A"
+
+    # Extract problem counts
+    counts = {difficulty: 0 for difficulty in GFG_DIFFICULTIES}
+    for text in fields["Problem_Counts"]:
+        if "(" in text and ")" in text:
+            category, count = text.rsplit(" (", 1)
+            category = category.strip().capitalize()
+            if category in counts:
+                counts[category] = int(count.rstrip(")"))
+
+    return {
+        "Username": username,
+        "Coding_Score": coding_score,
+        "Counts": counts
+    }
+
+
 def scrape_gfg_profile(url):
     """Scrape a user's GeeksforGeeks profile for coding statistics."""
     if not url or pd.isna(url) or url.strip() == "":
@@ -147,52 +349,20 @@ def scrape_gfg_profile(url):
     if not response:
         return {"Error": "Invalid or inaccessible URL", "Total_Score": 0}
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-
     try:
-        # Extract username
-        username_tag = soup.find(
-            "div", class_="profilePicSection_head_userHandle__oOfFy")
-        if not username_tag:
-            raise ValueError("Username not found in profile")
-
-        username = username_tag.text.strip()
-
-        # Extract coding score and problems solved
-        scores = soup.find_all("div",
-                               class_="scoreCard_head_left--score__oSi_x")
-        coding_score = scores[0].text.strip() if len(scores) > 0 else "N/A"
-        problems_solved = scores[1].text.strip() if len(scores) > 1 else "N/A"
-
-        # Extract problem counts
-        problem_counts = soup.find_all(
-            "div", class_="problemNavbar_head_nav--text__UaGCx")
-        problems_dict = {
-            "School": 0,
-            "Basic": 0,
-            "Easy": 0,
-            "Medium": 0,
-            "Hard": 0,
-            "Total": 0
-        }
-
-        for problem in problem_counts:
-            text = problem.text.strip()
-            if "(" in text and ")" in text:
-                category, count = text.rsplit(" (", 1)
-                count = int(count.rstrip(")"))
-                category = category.strip().upper()
-
-                if category == "SCHOOL":
-                    problems_dict["School"] = count
-                elif category == "BASIC":
-                    problems_dict["Basic"] = count
-                elif category == "EASY":
-                    problems_dict["Easy"] = count
-                elif category == "MEDIUM":
-                    problems_dict["Medium"] = count
-                elif category == "HARD":
-                    problems_dict["Hard"] = count
+        fields = None
+        if EXTRACTION_MODE in ("auto", "api"):
+            fields = gfg_fields_from_next_data(find_script_json(response.text))
+        if fields is None:
+            soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                fields = _gfg_fields_from_dom(soup)
+            finally:
+                soup.decompose()
+
+        username = fields["Username"]
+        coding_score = fields["Coding_Score"]
+        problems_dict = dict(fields["Counts"])
 
         # Calculate total problems solved (School + Basic + Easy + Medium + Hard)
         problems_dict["Total"] = (problems_dict["School"] +
@@ -236,22 +406,10 @@ def extract_username(url):
     if not url or pd.isna(url) or url.strip() == "":
         return "N/A"
 
-    url = url.rstrip("/")
-    parts = url.split("/")
-
-    # Extract username from various URL formats
-    if "leetcode.com" in url:
-        if "u" in parts and parts[-2] == "u":  # Handles '/u/username' format
-            return parts[-1]
-        return parts[-1]  # Default case for 'leetcode.com/username'
-    elif "codechef.com" in url:
-        return parts[-1]
-    elif "hackerrank.com" in url:
-        return parts[-1]
-    elif "geeksforgeeks.org" in url:
-        return parts[-1]
-
-    return "N/A"
+    identity = canonical_profile(url)
+    if identity is None:
+        return "N/A"
+    return identity.username
 
 
 def fetch_leetcode_data(username):
@@ -282,18 +440,29 @@ def fetch_leetcode_data(username):
     headers = {"Content-Type": "application/json"}
 
     try:
-        response = requests.post("https://leetcode.com/graphql",
-                                 json={"query": query},
-                                 headers=headers,
-                                 timeout=15)
+        response = platform_request("LeetCode",
+                                    "POST",
+                                    "https://leetcode.com/graphql",
+                                    json={"query": query},
+                                    headers=headers,
+                                    timeout=15)
 
         if response.status_code == 200:
             data = response.json()
             if "errors" in data:
+                # Only LeetCode's own "user does not exist" error means the
+                # profile is gone; rate limits and query errors do not.
+                if any("does not exist" in str(error.get("message")).lower()
+                       for error in data["errors"] or []
+                       if isinstance(error, dict)):
+                    DEAD_PROFILES.mark_dead("LeetCode", username,
+                                            "User does not exist")
                 return None
             return data.get("data", {})
         else:
             return None
+    except PlatformUnavailableError:
+        raise
     except Exception:
         return None
 
@@ -396,6 +565,8 @@ def get_leetcode_profile(url):
             "Contests_Attended": contests_attended,
             "Rating": rating
         }
+    except PlatformUnavailableError:
+        raise
     except Exception as e:
         print(f"Error in get_leetcode_profile: {e}")
         return {
@@ -412,22 +583,71 @@ def get_leetcode_profile(url):
         }
 
 
-def fetch_profile_data(url, fetch_function, results, key, lock):
+def _dead_profile_reason(platform, url, identity):
+    """Reason to skip a profile without any network I/O, or None."""
+    reason = validate_profile_url(platform, url)
+    if reason:
+        return reason
+    reason = DEAD_PROFILES.lookup(platform, identity.username)
+    if reason:
+        return f"Known dead profile ({reason})"
+    return None
+
+
+def stale_profile(roll_no, platform, error):
+    """Fallback for an unavailable platform: previous value, never fresh zeros."""
+    previous = previous_profile(roll_no, platform)
+    if previous is not None:
+        return {**previous, "Status": "stale—kept previous value"}
+    return {
+        "error": str(error),
+        "Status": "stale—no previous value",
+        "Total_Score": 0
+    }
+
+
+def _fetch_profile(fetch_function, identity):
+    """Run a scraper on a canonical profile URL and normalise its result."""
+    profile_data = fetch_function(identity.canonical_url)
+    # Ensure Total_Score key exists and has correct name
+    if "Total Score" in profile_data and "Total_Score" not in profile_data:
+        profile_data["Total_Score"] = profile_data.pop("Total Score")
+    elif "Total_Score" not in profile_data:
+        profile_data["Total_Score"] = 0
+    profile_data["Profile_URL"] = identity.canonical_url
+    return profile_data
+
+
+def fetch_profile_data(url, fetch_function, results, key, lock, roll_no=None):
     """Thread-safe function to fetch profile data with proper error handling"""
     try:
         if pd.isna(url) or not url or url.strip() == "":
             profile_data = {"Total_Score": 0}
         else:
-            profile_data = fetch_function(url)
-            # Ensure Total_Score key exists and has correct name
-            if "Total Score" in profile_data and "Total_Score" not in profile_data:
-                profile_data["Total_Score"] = profile_data.pop("Total Score")
-            elif "Total_Score" not in profile_data:
-                profile_data["Total_Score"] = 0
+            # Malformed or known-dead profiles are skipped before any network I/O
+            identity = canonical_profile(url)
+            skip_reason = _dead_profile_reason(key, url, identity)
+            if skip_reason:
+                INVALID_PROFILES.add(roll_no, key, url, skip_reason)
+                profile_data = {"error": skip_reason, "Total_Score": 0}
+            else:
+                # Students sharing a profile are fetched once per run
+                profile_data = PROFILE_RESULTS.get_or_fetch(
+                    identity.key,
+                    lambda: _fetch_profile(fetch_function, identity))
+                dead_reason = DEAD_PROFILES.lookup(key, identity.username)
+                if dead_reason:
+                    INVALID_PROFILES.add(roll_no, key, url, dead_reason)
+                elif (LAST_GOOD is not None and roll_no
+                      and is_good_profile(key, profile_data)):
+                    LAST_GOOD.put(roll_no, key, profile_data)
 
         # Thread-safe update of results dictionary
         with lock:
             results[key] = profile_data
+    except PlatformUnavailableError as e:
+        with lock:
+            results[key] = stale_profile(roll_no, key, e)
     except Exception as e:
         print(f"Error in fetch_profile_data for {key}: {str(e)}")
         print(traceback.format_exc())
@@ -435,61 +655,216 @@ def fetch_profile_data(url, fetch_function, results, key, lock):
             results[key] = {"Total_Score": 0, "Error": str(e)}
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Scrape coding profiles for every student in a roster.")
+    parser.add_argument("excel_path", help="Roster workbook (.xlsx)")
+    parser.add_argument(
+        "--extraction",
+        choices=("auto", "api", "dom"),
+        default="auto",
+        help="'auto' decodes JSON embedded in GFG pages and falls back to the "
+        "DOM extractors; 'api' also reads HackerRank from its JSON endpoints "
+        "(2 requests per student); 'dom' always parses the HTML "
+        "(default: auto)")
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output encoder: indented JSON (default), compact JSON, "
+        "MessagePack, or flattened per-platform metrics as Parquet/CSV")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Results file (default: students_profiles.<format extension>, "
+        "prefixed with loadtest_ under --record/--replay-url)")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Memory-bounded mode: chunked roster reading, bounded "
+        "concurrency and incremental output")
+    parser.add_argument("--chunk-size",
+                        type=int,
+                        default=500,
+                        help="Roster rows read per chunk in --stream mode")
+    parser.add_argument("--max-in-flight",
+                        type=int,
+                        default=8,
+                        help="Students scraped concurrently in --stream mode")
+    parser.add_argument(
+        "--max-rss-mb",
+        type=float,
+        default=None,
+        help="RSS ceiling in MiB; concurrency is throttled while exceeded")
+    parser.add_argument(
+        "--previous",
+        default=None,
+        help="Results of the previous run, used as last known good values "
+        "for students missing from --last-good (default: the --output file, "
+        "or students_profiles.json for flattened csv/parquet output)")
+    parser.add_argument(
+        "--last-good",
+        default=None,
+        help="Persistent per-student store of last known good values, kept "
+        "across roster uploads (default: last_known_good.sqlite3)")
+    parser.add_argument(
+        "--dead-profiles",
+        default=None,
+        help="Persistent index of profiles known not to exist "
+        "(default: dead_profiles.json)")
+    parser.add_argument("--dead-ttl-days",
+                        type=float,
+                        default=7,
+                        help="Days before a dead profile is checked again")
+    parser.add_argument(
+        "--invalid-report",
+        default=None,
+        help="CSV listing malformed and dead profiles for admins to fix "
+        "(default: invalid_profiles_report.csv)")
+    parser.add_argument(
+        "--breaker-failure-rate",
+        type=float,
+        default=0.5,
+        help="Failure rate that opens a platform's circuit breaker")
+    parser.add_argument(
+        "--breaker-min-calls",
+        type=int,
+        default=5,
+        help="Requests seen before a breaker may open")
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=60.0,
+        help="Seconds an open breaker waits before sending a probe")
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument(
+        "--record",
+        metavar="DIR",
+        default=None,
+        help="Record every live response to DIR for load-test replay")
+    replay.add_argument(
+        "--replay-url",
+        default=None,
+        help="Send all requests to a loadtest.py replay server instead")
+    # Load-test runs must never touch the files the server reads or keeps
+    # between production runs, so their defaults get a distinct prefix.
+    args = parser.parse_args(argv)
+    prefix = "loadtest_" if args.record or args.replay_url else ""
+    if args.output is None:
+        args.output = default_output_path(args.format,
+                                          prefix + "students_profiles")
+    if args.previous is None:
+        # Flattened exports cannot be read back into profiles
+        if args.format in ("csv", "parquet"):
+            args.previous = default_output_path("json",
+                                                prefix + "students_profiles")
+        else:
+            args.previous = args.output
+    if args.last_good is None:
+        args.last_good = prefix + "last_known_good.sqlite3"
+    if args.dead_profiles is None:
+        args.dead_profiles = prefix + "dead_profiles.json"
+    if args.invalid_report is None:
+        args.invalid_report = prefix + "invalid_profiles_report.csv"
+    return args
+
+
+def scrape_student(row):
+    """Fetch all four platforms for one roster row concurrently."""
+    roll_no = str(row["Roll Number"]).strip()
+    gfg_url = row.get("GeeksforGeeks", "")
+    codechef_url = row.get("CodeChef", "")
+    hackerrank_url = row.get("HackerRank", "")
+    leetcode_url = row.get("LeetCode", "")
+
+    results = {}
+    threads = []
+
+    # Create a lock for thread-safe dictionary updates
+    results_lock = threading.Lock()
+
+    # Create threads for all platforms
+    threads.append(
+        threading.Thread(target=fetch_profile_data,
+                         args=(codechef_url, scrape_codechef_profile, results,
+                               "CodeChef", results_lock, roll_no)))
+
+    threads.append(
+        threading.Thread(target=fetch_profile_data,
+                         args=(gfg_url, scrape_gfg_profile, results,
+                               "GeeksForGeeks", results_lock, roll_no)))
+
+    threads.append(
+        threading.Thread(target=fetch_profile_data,
+                         args=(hackerrank_url, get_hackerrank_profile, results,
+                               "HackerRank", results_lock, roll_no)))
+
+    threads.append(
+        threading.Thread(target=fetch_profile_data,
+                         args=(leetcode_url, get_leetcode_profile, results,
+                               "LeetCode", results_lock, roll_no)))
+
+    # Start all threads
+    for thread in threads:
+        thread.start()
+
+    # Wait for all threads to complete
+    for thread in threads:
+        thread.join()
+
+    return roll_no, {"Profiles": {**results}}
+
+
 def main():
+    global EXTRACTION_MODE, PREVIOUS_RESULTS_PATH, LAST_GOOD, DEAD_PROFILES
+    global RECORDER, REPLAY_URL
+
+    args = parse_args()
+    EXTRACTION_MODE = args.extraction
+    PREVIOUS_RESULTS_PATH = args.previous
+    LAST_GOOD = LastGoodStore(args.last_good)
+    configure_breakers(failure_rate=args.breaker_failure_rate,
+                       min_calls=args.breaker_min_calls,
+                       cooldown=args.breaker_cooldown)
+    DEAD_PROFILES = DeadProfileIndex(args.dead_profiles, args.dead_ttl_days)
+    if args.record:
+        RECORDER = CassetteRecorder(args.record)
+    REPLAY_URL = args.replay_url
+
     try:
-        df = pd.read_excel(sys.argv[1])
-        student_profiles = {}
-
-        # Create a lock for thread-safe dictionary updates
-        results_lock = threading.Lock()
-
-        for _, row in df.iterrows():
-            roll_no = str(row["Roll Number"]).strip()
-            gfg_url = row.get("GeeksforGeeks", "")
-            codechef_url = row.get("CodeChef", "")
-            hackerrank_url = row.get("HackerRank", "")
-            leetcode_url = row.get("LeetCode", "")
-
-            results = {}
-            threads = []
-
-            # Create threads for all platforms
-            threads.append(
-                threading.Thread(target=fetch_profile_data,
-                                 args=(codechef_url, scrape_codechef_profile,
-                                       results, "CodeChef", results_lock)))
-
-            threads.append(
-                threading.Thread(target=fetch_profile_data,
-                                 args=(gfg_url, scrape_gfg_profile, results,
-                                       "GeeksForGeeks", results_lock)))
-
-            threads.append(
-                threading.Thread(target=fetch_profile_data,
-                                 args=(hackerrank_url, get_hackerrank_profile,
-                                       results, "HackerRank", results_lock)))
-
-            threads.append(
-                threading.Thread(target=fetch_profile_data,
-                                 args=(leetcode_url, get_leetcode_profile,
-                                       results, "LeetCode", results_lock)))
-
-            # Start all threads
-            for thread in threads:
-                thread.start()
-
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
-
-            student_profiles[roll_no] = {"Profiles": {**results}}
-
-        # Write the results to a JSON file
-        with open("students_profiles.json", "w", encoding="utf-8") as f:
-            json.dump({"Profiles": student_profiles},
-                      f,
-                      indent=4,
-                      default=list)
+        writer = open_writer(args.format, args.output)
+        if args.stream:
+            # Memory-bounded mode: read the roster in chunks, keep at most
+            # --max-in-flight students in memory and stream results to disk.
+            run_bounded(iter_roster_chunks(args.excel_path, args.chunk_size),
+                        scrape_student,
+                        writer,
+                        max_in_flight=args.max_in_flight,
+                        max_rss_mb=args.max_rss_mb)
+        else:
+            df = pd.read_excel(args.excel_path)
+
+            for _, row in df.iterrows():
+                roll_no, profile = scrape_student(row)
+                writer.write(roll_no, profile)
+
+        # Write the results file (students_profiles.json by default)
+        writer.close()
+
+        LAST_GOOD.close()
+        DEAD_PROFILES.save()
+        if len(INVALID_PROFILES):
+            INVALID_PROFILES.write_csv(args.invalid_report)
+            print(f"{len(INVALID_PROFILES)} invalid or dead profiles listed "
+                  f"in {args.invalid_report}")
+
+        breakers = breaker_report()
+        if breakers:
+            print(f"Circuit breakers tripped: {json.dumps(breakers)}")
+
+        drift = schema_drift_report()
+        if drift:
+            print(f"Schema drift detected: {json.dumps(drift)}")
 
     except Exception as e:
         print(f"Error in main function: {str(e)}")
@@ -0,0 +1,226 @@
+import threading
+from collections import Counter
+
+import soupsieve
+
+
+def _text(tag):
+    return tag.text.strip()
+
+
+def _int_text(tag):
+    return int(tag.text.strip())
+
+
+# Declarative extractor registry.
+#
+# Each platform maps output fields to a list of CSS selector versions, tried
+# in order. The first entry is the selector the site currently ships; the
+# later ones are looser fallbacks that survive a redeploy which only changes
+# the hashed part of a class name. Field options:
+#   selectors  - selector versions, most specific first
+#   transform  - applied to each matched tag (default: stripped text)
+#   many       - collect every match instead of the first one
+#   reduce     - applied to the list of matches of a "many" field
+#   fields     - nested spec evaluated against each match of a "many" field
+#   default    - value used when no selector version matches
+#   optional   - an empty match is legitimate and is not counted as drift
+#
+# Every platform needs at least one non-optional field that is always on a
+# real profile page; otherwise a redesign silently yields empty results.
+EXTRACTOR_SPECS = {
+    "GeeksForGeeks": {
+        "Username": {
+            "selectors": [
+                "div.profilePicSection_head_userHandle__oOfFy",
+                "div[class*='profilePicSection_head_userHandle']",
+                "div[class*='userHandle']",
+            ],
+        },
+        "Scores": {
+            "selectors": [
+                "div.scoreCard_head_left--score__oSi_x",
+                "div[class*='scoreCard_head_left--score']",
+            ],
+            "many": True,
+        },
+        "Problem_Counts": {
+            "selectors": [
+                "div.problemNavbar_head_nav--text__UaGCx",
+                "div[class*='problemNavbar_head_nav--text']",
+            ],
+            "many": True,
+        },
+    },
+    "CodeChef": {
+        "Username": {
+            "selectors": [
+                "span.m-username--link",
+                "span[class*='username']",
+            ],
+        },
+        "Star": {
+            "selectors": [
+                "span.rating",
+                ".rating-star span",
+            ],
+        },
+        "Rating": {
+            "selectors": [
+                "div.rating-number",
+                "div[class*='rating-number']",
+            ],
+        },
+        "Contests_Participated": {
+            "selectors": [
+                "div.contest-participated-count b",
+                "div[class*='contest-participated'] b",
+            ],
+            "transform": _int_text,
+        },
+    },
+    "HackerRank": {
+        # Page marker: badges and certificates may legitimately be empty, so
+        # this required field is what makes a redesign show up as drift.
+        "Profile_Header": {
+            "selectors": [
+                ".profile-username-heading",
+                "[class*='profile-username']",
+                "[class*='profile-heading']",
+                "[class*='ProfileHeader']",
+            ],
+        },
+        "Badges": {
+            "selectors": [
+                "svg.hexagon",
+                "svg[class*='hexagon']",
+            ],
+            "many": True,
+            "optional": True,
+            "fields": {
+                "name": {
+                    "selectors": ["text.badge-title"],
+                    "default": "Unknown Badge",
+                    "optional": True,
+                },
+                "stars": {
+                    "selectors": ["g.star-section svg.badge-star"],
+                    "many": True,
+                    "reduce": len,
+                    "optional": True,
+                },
+            },
+        },
+        "Certifications": {
+            "selectors": [
+                "h2.certificate_v3-heading",
+                "h2[class*='certificate'][class*='heading']",
+            ],
+            "many": True,
+            "optional": True,
+        },
+    },
+}
+
+# Schema drift metric: (platform, field, outcome) -> count, where outcome is
+# "fallback" (a later selector version matched) or "missing" (none matched).
+SCHEMA_DRIFT = Counter()
+_drift_lock = threading.Lock()
+
+
+def _record_drift(platform, field, outcome):
+    with _drift_lock:
+        SCHEMA_DRIFT[(platform, field, outcome)] += 1
+
+
+def schema_drift_report():
+    """Return the schema drift counters as a nested, JSON-friendly dict."""
+    report = {}
+    with _drift_lock:
+        for (platform, field, outcome), count in SCHEMA_DRIFT.items():
+            report.setdefault(platform, {}).setdefault(field, {})[outcome] = count
+    return report
+
+
+class _FieldPlan:
+    """A single field of a parse plan with its selectors precompiled."""
+
+    def __init__(self, platform, name, spec):
+        self.platform = platform
+        self.name = name
+        self.selectors = [soupsieve.compile(s) for s in spec["selectors"]]
+        self.transform = spec.get("transform", _text)
+        self.many = spec.get("many", False)
+        self.reduce = spec.get("reduce")
+        self.default = spec.get("default", [] if self.many else None)
+        self.optional = spec.get("optional", False)
+        self.fields = [
+            _FieldPlan(platform, f"{name}.{sub_name}", sub_spec)
+            for sub_name, sub_spec in spec.get("fields", {}).items()
+        ]
+
+    def _match(self, node):
+        for version, selector in enumerate(self.selectors):
+            if self.many:
+                found = selector.select(node)
+            else:
+                found = selector.select_one(node)
+            if found:
+                if version > 0:
+                    _record_drift(self.platform, self.name, "fallback")
+                return found
+        if not self.optional:
+            _record_drift(self.platform, self.name, "missing")
+        return None
+
+    def _convert(self, tag):
+        if self.fields:
+            return {
+                field.name.rsplit(".", 1)[-1]: field.extract(tag)
+                for field in self.fields
+            }
+        return self.transform(tag)
+
+    def extract(self, node):
+        found = self._match(node)
+        if self.many:
+            if self.reduce is not None:
+                return self.reduce(found or [])
+            if not found:
+                return self.default
+            return [self._convert(tag) for tag in found]
+        if found is None:
+            return self.default
+        return self._convert(found)
+
+
+class ParsePlan:
+    """Compiled extractor for one platform, reusable across pages."""
+
+    def __init__(self, platform, spec):
+        self.platform = platform
+        self.fields = [_FieldPlan(platform, name, field_spec)
+                       for name, field_spec in spec.items()]
+
+    def extract(self, soup):
+        """Run every field of the plan against a parsed page."""
+        return {field.name: field.extract(soup) for field in self.fields}
+
+
+PARSE_PLANS = {}
+
+
+def register_extractor(platform, spec):
+    """Add or replace a platform's extractor spec and compile its plan."""
+    EXTRACTOR_SPECS[platform] = spec
+    PARSE_PLANS[platform] = ParsePlan(platform, spec)
+    return PARSE_PLANS[platform]
+
+
+def get_parse_plan(platform):
+    """Return the compiled parse plan for a platform."""
+    return PARSE_PLANS[platform]
+
+
+for _platform, _spec in list(EXTRACTOR_SPECS.items()):
+    register_extractor(_platform, _spec)
@@ -0,0 +1,104 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+# Key only present when a platform's profile was actually parsed; the
+# zero-score fallbacks the scrapers return on a parse failure lack it.
+REQUIRED_KEYS = {
+    "GeeksForGeeks": "Problems_by_Difficulty",
+    "CodeChef": "Contests_Participated",
+    "HackerRank": "Badges",
+    "LeetCode": "Problems",
+}
+
+
+def is_good_profile(platform, profile):
+    """True for a freshly parsed result worth keeping as last known good.
+
+    Errors, stale markers and parse-failure fallbacks ("__" placeholders,
+    missing platform fields) are rejected, and so are zero scores: after a
+    site redesign every student would otherwise be overwritten with zeros,
+    and a real zero has nothing worth preserving anyway.
+    """
+    if not profile or any(key in profile
+                          for key in ("error", "Error", "Status")):
+        return False
+    if profile.get("Coding_Score") == "__":
+        return False
+    if REQUIRED_KEYS.get(platform, "Total_Score") not in profile:
+        return False
+    try:
+        return float(profile.get("Total_Score") or 0) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+class LastGoodStore:
+    """Persistent last known good result per (roll number, platform).
+
+    Unlike the previous run's output file, which the server overwrites on
+    every roster upload, this store accumulates across rosters, so an
+    outage during one college's upload can still fall back to values
+    scraped for those students in an earlier run. Backed by SQLite so
+    lookups stay on disk for large rosters.
+    """
+
+    COMMIT_EVERY = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS last_good ("
+                           "roll_no TEXT NOT NULL, "
+                           "platform TEXT NOT NULL, "
+                           "profile TEXT NOT NULL, "
+                           "updated_at REAL NOT NULL, "
+                           "PRIMARY KEY (roll_no, platform))")
+        self._conn.commit()
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+
+    def get(self, roll_no, platform):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT profile FROM last_good WHERE roll_no = ? AND "
+                "platform = ?", (roll_no, platform)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, roll_no, platform, profile):
+        encoded = json.dumps(profile, default=list)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO last_good VALUES (?, ?, ?, ?)",
+                (roll_no, platform, encoded, time.time()))
+            self._uncommitted += 1
+            if self._uncommitted >= self.COMMIT_EVERY:
+                self._conn.commit()
+                self._uncommitted = 0
+
+    def import_profiles(self, profiles):
+        """Add good entries of a {roll_no: {"Profiles": ...}} mapping.
+
+        Used to seed the store from an older results file; entries the
+        store already has are newer and are left alone. Returns the number
+        of entries added.
+        """
+        rows = [(str(roll_no), platform, json.dumps(profile, default=list),
+                 time.time())
+                for roll_no, student in profiles.items()
+                for platform, profile in ((student or {}).get("Profiles")
+                                          or {}).items()
+                if is_good_profile(platform, profile)]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO last_good VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
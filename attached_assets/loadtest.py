@@ -0,0 +1,418 @@
+"""Record/replay harness for load-testing extractData_copy.py.
+
+Record real responses while scraping a roster:
+
+    python attached_assets/extractData_copy.py roster.xlsx --record cassettes/
+
+Serve them back with injected latency, errors and 429s:
+
+    python attached_assets/loadtest.py serve cassettes/ --latency lognormal:-1.5,0.5 \
+        --error-rate 0.01 --throttle-rate CodeChef=0.05
+
+Check that HackerRank's JSON endpoints (--extraction api) give the same
+badges and certificates as its profile page, after recording both paths:
+
+    python attached_assets/extractData_copy.py roster.xlsx --extraction dom --record cassettes/
+    python attached_assets/extractData_copy.py roster.xlsx --extraction api --record cassettes/
+    python attached_assets/loadtest.py verify-hackerrank cassettes/
+
+Generate a large synthetic roster and scrape it against the replay server:
+
+    python attached_assets/loadtest.py roster big.xlsx --students 50000 --cassettes cassettes/
+    python attached_assets/extractData_copy.py big.xlsx --stream \
+        --replay-url http://127.0.0.1:8765
+
+With --record or --replay-url the results, dead-profile index, last known
+good store and invalid-profile report default to loadtest_-prefixed files,
+so load tests never overwrite the server's production state.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+REPLAY_PATH = "/replay"
+
+# Roster columns, in the order the college rosters use them.
+ROSTER_COLUMNS = ("Roll Number", "Name", "GeeksforGeeks", "HackerRank",
+                  "CodeChef", "LeetCode")
+
+SYNTHETIC_URLS = {
+    "GeeksforGeeks": "https://www.geeksforgeeks.org/user/{username}/",
+    "HackerRank": "https://www.hackerrank.com/profile/{username}",
+    "CodeChef": "https://www.codechef.com/users/{username}",
+    "LeetCode": "https://leetcode.com/u/{username}/",
+}
+
+# Cassette platform name for each roster column.
+COLUMN_PLATFORMS = {
+    "GeeksforGeeks": "GeeksForGeeks",
+    "HackerRank": "HackerRank",
+    "CodeChef": "CodeChef",
+    "LeetCode": "LeetCode",
+}
+
+
+def request_key(method, url, body=None):
+    """Stable key for a request: method, URL and canonical JSON body."""
+    encoded = json.dumps(body, sort_keys=True) if body is not None else ""
+    return hashlib.sha1(f"{method.upper()} {url} {encoded}".encode()).hexdigest()
+
+
+class CassetteRecorder:
+    """Appends every live response to <directory>/<platform>.jsonl."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def record(self, platform, method, url, body, response):
+        entry = {
+            "key": request_key(method, url, body),
+            "method": method.upper(),
+            "url": url,
+            "body": body,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "text/html"),
+            "text": response.text,
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            path = os.path.join(self.directory, f"{platform}.jsonl")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def replay_request(replay_url, platform, method, url, **kwargs):
+    """Send a scraper request to the replay server instead of the live site."""
+    envelope = {
+        "platform": platform,
+        "method": method.upper(),
+        "url": url,
+        "body": kwargs.get("json"),
+    }
+    return requests.post(replay_url.rstrip("/") + REPLAY_PATH,
+                         json=envelope,
+                         timeout=kwargs.get("timeout"))
+
+
+def load_cassettes(directory):
+    """Load recorded responses as ({key: entry}, {platform: [entries]})."""
+    by_key = {}
+    by_platform = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".jsonl"):
+            continue
+        platform = name[:-len(".jsonl")]
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                by_key[entry["key"]] = entry
+                by_platform.setdefault(platform, []).append(entry)
+    return by_key, by_platform
+
+
+def parse_latency(spec):
+    """Parse 'fixed:S', 'uniform:LO,HI' or 'lognormal:MU,SIGMA' (seconds)."""
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    raise argparse.ArgumentTypeError(f"Invalid latency distribution: {spec}")
+
+
+def parse_rates(specs):
+    """Turn ['0.01', 'CodeChef=1'] into {None: 0.01, 'CodeChef': 1.0}."""
+    rates = {}
+    for spec in specs or []:
+        platform, sep, value = spec.rpartition("=")
+        rates[platform if sep else None] = float(value)
+    return rates
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The socketserver default backlog of 5 drops connections long before
+    # a high-concurrency scrape saturates the handler threads.
+    request_queue_size = 1024
+
+    def __init__(self, address, cassette_dir, latency, error_rates,
+                 throttle_rates, seed=0):
+        super().__init__(address, ReplayHandler)
+        self.by_key, self.by_platform = load_cassettes(cassette_dir)
+        self.latency = latency
+        self.error_rates = error_rates
+        self.throttle_rates = throttle_rates
+        self.seed = seed
+        self.stats = Counter()
+        self._seen = Counter()
+        self._lock = threading.Lock()
+
+    def rng_for(self, key):
+        """Per-request RNG: the same request sequence replays identically."""
+        with self._lock:
+            occurrence = self._seen[key]
+            self._seen[key] += 1
+        return random.Random(f"{self.seed}:{key}:{occurrence}")
+
+    def count(self, platform, status):
+        """Tally a served response; handler threads run concurrently."""
+        with self._lock:
+            self.stats[(platform, status)] += 1
+
+    def rate(self, rates, platform):
+        return rates.get(platform, rates.get(None, 0.0))
+
+    def lookup(self, platform, key):
+        """Exact recording if present, else a deterministic stand-in."""
+        entry = self.by_key.get(key)
+        if entry is not None:
+            return entry
+        candidates = self.by_platform.get(platform)
+        if not candidates:
+            return None
+        return candidates[int(key, 16) % len(candidates)]
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, content_type, text):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != REPLAY_PATH:
+            self._send(404, "text/plain", "unknown endpoint")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        envelope = json.loads(self.rfile.read(length))
+        platform = envelope["platform"]
+        key = request_key(envelope["method"], envelope["url"],
+                          envelope.get("body"))
+
+        server = self.server
+        rng = server.rng_for(key)
+        time.sleep(max(0.0, server.latency(rng)))
+
+        if rng.random() < server.rate(server.throttle_rates, platform):
+            server.count(platform, 429)
+            self._send(429, "text/plain", "Too Many Requests")
+            return
+        if rng.random() < server.rate(server.error_rates, platform):
+            status = rng.choice((500, 502, 503))
+            server.count(platform, status)
+            self._send(status, "text/plain", "Injected error")
+            return
+
+        entry = server.lookup(platform, key)
+        if entry is None:
+            server.count(platform, 404)
+            self._send(404, "text/plain", "No recording for platform")
+            return
+        server.count(platform, entry["status"])
+        self._send(entry["status"], entry["content_type"], entry["text"])
+
+
+_LEETCODE_USERNAME = re.compile(r'username:\s*"([^"]+)"')
+
+
+def _recorded_username(platform, entry):
+    """Username a recorded request was made for, or None."""
+    if platform == "LeetCode":
+        match = _LEETCODE_USERNAME.search((entry.get("body") or {}).get(
+            "query", ""))
+        return match.group(1) if match else None
+    parsed = urlsplit(entry["url"])
+    query = parse_qs(parsed.query)
+    if "username" in query:
+        return query["username"][0]
+    parts = [part for part in parsed.path.split("/") if part]
+    if "hackers" in parts and parts.index("hackers") + 1 < len(parts):
+        return parts[parts.index("hackers") + 1]
+    return parts[-1] if parts else None
+
+
+def recorded_usernames(cassette_dir):
+    """Usernames seen in recorded requests, per roster column."""
+    usernames = {column: [] for column in COLUMN_PLATFORMS}
+    if not cassette_dir:
+        return usernames
+    _, by_platform = load_cassettes(cassette_dir)
+    for column, platform in COLUMN_PLATFORMS.items():
+        seen = set()
+        for entry in by_platform.get(platform, []):
+            username = _recorded_username(platform, entry)
+            if username and username not in seen:
+                seen.add(username)
+                usernames[column].append(username)
+    return usernames
+
+
+def verify_hackerrank(cassette_dir):
+    """Run HackerRank's JSON-endpoint and profile-page extractors on recordings.
+
+    Returns {username: (api_fields, dom_fields)} for every user whose page
+    and both endpoints were recorded with HTTP 200.
+    """
+    from bs4 import BeautifulSoup
+
+    from embedded_json import (hackerrank_badges_from_api,
+                               hackerrank_certificates_from_api)
+    from extractors import get_parse_plan
+
+    pages, badges, certificates = {}, {}, {}
+    _, by_platform = load_cassettes(cassette_dir)
+    for entry in by_platform.get("HackerRank", []):
+        username = _recorded_username("HackerRank", entry)
+        if entry["status"] != 200 or not username:
+            continue
+        if "/rest/hackers/" in entry["url"]:
+            badges[username.lower()] = json.loads(entry["text"])
+        elif "hacker_certificate" in entry["url"]:
+            certificates[username.lower()] = json.loads(entry["text"])
+        else:
+            pages[username.lower()] = entry["text"]
+
+    comparisons = {}
+    for username in sorted(pages.keys() & badges.keys() & certificates.keys()):
+        soup = BeautifulSoup(pages[username], "html.parser")
+        dom = get_parse_plan("HackerRank").extract(soup)
+        soup.decompose()
+        api = {
+            "Badges": hackerrank_badges_from_api(badges[username]),
+            "Certifications":
+            hackerrank_certificates_from_api(certificates[username]),
+        }
+        comparisons[username] = tuple({
+            "Badges": sorted(fields["Badges"] or [],
+                             key=lambda badge: badge["name"]),
+            "Certifications": sorted(fields["Certifications"] or []),
+        } for fields in (api, dom))
+    return comparisons
+
+
+def generate_roster(path, students, seed=0, cassette_dir=None,
+                    blank_rate=0.05, malformed_rate=0.01):
+    """Write a synthetic roster workbook with the real rosters' columns."""
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    usernames = recorded_usernames(cassette_dir)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(ROSTER_COLUMNS)
+    for n in range(students):
+        roll_no = f"{22 + n // 100000 % 4}A91A{n % 100000:05d}"
+        row = [roll_no, f"Student {n}"]
+        for column in ROSTER_COLUMNS[2:]:
+            draw = rng.random()
+            if draw < blank_rate:
+                row.append(None)
+            elif draw < blank_rate + malformed_rate:
+                row.append(f"https://example.com/{column.lower()}/{n}")
+            else:
+                pool = usernames[column]
+                username = rng.choice(pool) if pool else f"student{n}"
+                row.append(SYNTHETIC_URLS[column].format(username=username))
+        sheet.append(row)
+    workbook.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay server and synthetic rosters for load tests.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Serve recorded responses")
+    serve.add_argument("cassettes", help="Directory written by --record")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency",
+                       type=parse_latency,
+                       default=parse_latency("fixed:0"),
+                       help="fixed:S, uniform:LO,HI or lognormal:MU,SIGMA")
+    serve.add_argument("--error-rate",
+                       action="append",
+                       help="5xx injection rate, optionally Platform=RATE")
+    serve.add_argument("--throttle-rate",
+                       action="append",
+                       help="429 injection rate, optionally Platform=RATE")
+    serve.add_argument("--seed", type=int, default=0)
+
+    roster = commands.add_parser("roster", help="Write a synthetic roster")
+    roster.add_argument("output", help="Workbook path (.xlsx)")
+    roster.add_argument("--students", type=int, default=10000)
+    roster.add_argument("--seed", type=int, default=0)
+    roster.add_argument("--cassettes",
+                        help="Draw usernames from recorded profiles")
+    roster.add_argument("--blank-rate", type=float, default=0.05)
+    roster.add_argument("--malformed-rate", type=float, default=0.01)
+
+    verify = commands.add_parser(
+        "verify-hackerrank",
+        help="Check the HackerRank API and page extractors agree")
+    verify.add_argument("cassettes", help="Directory written by --record")
+
+    args = parser.parse_args()
+
+    if args.command == "verify-hackerrank":
+        comparisons = verify_hackerrank(args.cassettes)
+        mismatches = 0
+        for username, (api, dom) in comparisons.items():
+            if api == dom:
+                print(f"{username}: match")
+            else:
+                mismatches += 1
+                print(f"{username}: MISMATCH\n  api: {api}\n  dom: {dom}")
+        if not comparisons:
+            print("No user has both the page and the JSON endpoints recorded")
+        if mismatches or not comparisons:
+            raise SystemExit(1)
+        return
+
+    if args.command == "roster":
+        generate_roster(args.output, args.students, args.seed,
+                        args.cassettes, args.blank_rate, args.malformed_rate)
+        print(f"Wrote {args.students} students to {args.output}")
+        return
+
+    server = ReplayServer((args.host, args.port), args.cassettes,
+                          args.latency, parse_rates(args.error_rate),
+                          parse_rates(args.throttle_rate), args.seed)
+    print(f"Replaying {len(server.by_key)} recorded responses on "
+          f"http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Responses served: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
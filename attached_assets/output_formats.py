@@ -0,0 +1,355 @@
+import argparse
+import csv
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+OUTPUT_FORMATS = ("json", "json-compact", "msgpack", "parquet", "csv")
+
+FORMAT_EXTENSIONS = {
+    "json": ".json",
+    "json-compact": ".json",
+    "msgpack": ".msgpack",
+    "parquet": ".parquet",
+    "csv": ".csv",
+}
+
+# Columns of the flattened per-student, per-platform export.
+FLAT_COLUMNS = (
+    ("Roll Number", "string"),
+    ("Platform", "string"),
+    ("Username", "string"),
+    ("Total_Score", "int"),
+    ("Easy", "int"),
+    ("Medium", "int"),
+    ("Hard", "int"),
+    ("Total_Problems", "int"),
+    ("Rating", "float"),
+    ("Contests", "int"),
+    ("Coding_Score", "string"),
+    ("Star", "string"),
+    ("Badge_Stars", "int"),
+    ("Certifications", "int"),
+    ("Status", "string"),
+    ("Error", "string"),
+    ("Profile_URL", "string"),
+)
+
+
+def default_output_path(output_format, base="students_profiles"):
+    return base + FORMAT_EXTENSIONS[output_format]
+
+
+def _number(value, cast):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten_profile(roll_no, profile):
+    """Yield one flat metrics row per platform of a student's result."""
+    for platform, data in (profile.get("Profiles") or {}).items():
+        data = data or {}
+        problems = data.get("Problems_by_Difficulty") or data.get(
+            "Problems") or {}
+        badges = data.get("Badges") or []
+        yield {
+            "Roll Number": roll_no,
+            "Platform": platform,
+            "Username": data.get("Username"),
+            "Total_Score": _number(data.get("Total_Score"), int),
+            "Easy": _number(problems.get("Easy"), int),
+            "Medium": _number(problems.get("Medium"), int),
+            "Hard": _number(problems.get("Hard"), int),
+            "Total_Problems": _number(
+                data.get("Total_Problems_Solved", problems.get("Total")), int),
+            "Rating": _number(data.get("Rating"), float),
+            "Contests": _number(
+                data.get("Contests_Attended",
+                         data.get("Contests_Participated")), int),
+            "Coding_Score": None if data.get("Coding_Score") is None else str(
+                data["Coding_Score"]),
+            "Star": data.get("Star"),
+            "Badge_Stars": sum(badge.get("stars", 0) for badge in badges)
+            if badges else None,
+            "Certifications": len(data["Certifications"])
+            if "Certifications" in data else None,
+            "Status": data.get("Status"),
+            "Error": data.get("error") or data.get("Error"),
+            "Profile_URL": data.get("Profile_URL"),
+        }
+
+
+class _AtomicWriter:
+    """Writes to <path>.tmp and renames it over <path> on close."""
+
+    mode = "w"
+
+    def __init__(self, path):
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        if "b" in self.mode:
+            self._file = open(self._tmp_path, self.mode)
+        else:
+            self._file = open(self._tmp_path,
+                              self.mode,
+                              encoding="utf-8",
+                              newline="")
+        self._lock = threading.Lock()
+
+    def _finish(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def close(self):
+        with self._lock:
+            self._finish()
+
+
+class JsonWriter(_AtomicWriter):
+    """Streams {"Profiles": {roll_no: profile, ...}} one student at a time.
+
+    With indent=4 the file is byte-for-byte what json.dump(..., indent=4)
+    writes for the whole dict; indent=None gives compact JSON.
+    """
+
+    def __init__(self, path, indent=4):
+        super().__init__(path)
+        self.indent = indent
+        self._first = True
+        if indent is None:
+            self._separators = (",", ":")
+            self._entry_prefix = ""
+            self._file.write('{"Profiles":{')
+        else:
+            self._separators = None
+            self._entry_prefix = "\n" + " " * (2 * indent)
+            self._file.write("{\n" + " " * indent + '"Profiles": {')
+
+    def write(self, roll_no, profile):
+        encoded = json.dumps(profile,
+                             indent=self.indent,
+                             separators=self._separators,
+                             default=list)
+        key = json.dumps(roll_no)
+        if self.indent is None:
+            entry = f"{key}:{encoded}"
+        else:
+            entry = f"{key}: " + encoded.replace("\n", self._entry_prefix)
+        with self._lock:
+            separator = "" if self._first else ","
+            self._first = False
+            self._file.write(separator + self._entry_prefix + entry)
+
+    def close(self):
+        with self._lock:
+            if self.indent is None:
+                self._file.write("}}")
+            elif self._first:
+                self._file.write("}\n}")
+            else:
+                self._file.write("\n" + " " * self.indent + "}\n}")
+            self._finish()
+
+
+class MsgpackWriter(_AtomicWriter):
+    """Streams the same {"Profiles": {...}} document as MessagePack.
+
+    MessagePack maps carry their length up front, so entries are packed
+    into a temporary body file and the header is written on close.
+    """
+
+    mode = "wb"
+
+    def __init__(self, path):
+        if msgpack is None:
+            raise RuntimeError(
+                "MessagePack output requires 'msgpack' (pip install msgpack)")
+        super().__init__(path)
+        self._packer = msgpack.Packer(default=list)
+        self._body = tempfile.TemporaryFile()
+        self._count = 0
+
+    def write(self, roll_no, profile):
+        packed = self._packer.pack(roll_no) + self._packer.pack(profile)
+        with self._lock:
+            self._body.write(packed)
+            self._count += 1
+
+    def close(self):
+        with self._lock:
+            self._file.write(self._packer.pack_map_header(1))
+            self._file.write(self._packer.pack("Profiles"))
+            self._file.write(self._packer.pack_map_header(self._count))
+            self._body.seek(0)
+            shutil.copyfileobj(self._body, self._file)
+            self._body.close()
+            self._finish()
+
+
+class CsvWriter(_AtomicWriter):
+    """Flattened per-student, per-platform metrics as CSV."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._writer = csv.DictWriter(self._file,
+                                      fieldnames=[c for c, _ in FLAT_COLUMNS])
+        self._writer.writeheader()
+
+    def write(self, roll_no, profile):
+        rows = list(flatten_profile(roll_no, profile))
+        with self._lock:
+            self._writer.writerows(rows)
+
+
+class ParquetWriter:
+    """Flattened per-student, per-platform metrics as Parquet.
+
+    Rows are buffered and flushed as one row group every `row_group_size`
+    rows, so memory stays bounded in --stream mode.
+    """
+
+    ARROW_TYPES = {"string": "string", "int": "int64", "float": "float64"}
+
+    def __init__(self, path, row_group_size=10000):
+        if pq is None:
+            raise RuntimeError(
+                "Parquet output requires 'pyarrow' (pip install pyarrow)")
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        self.row_group_size = row_group_size
+        self._schema = pa.schema([(name, self.ARROW_TYPES[kind])
+                                  for name, kind in FLAT_COLUMNS])
+        self._writer = pq.ParquetWriter(self._tmp_path, self._schema)
+        self._rows = []
+        self._lock = threading.Lock()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(
+                pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def write(self, roll_no, profile):
+        rows = list(flatten_profile(roll_no, profile))
+        with self._lock:
+            self._rows.extend(rows)
+            if len(self._rows) >= self.row_group_size:
+                self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._writer.close()
+            os.replace(self._tmp_path, self.path)
+
+
+def open_writer(output_format, path):
+    """Return a streaming writer (write(roll_no, profile) / close())."""
+    if output_format == "json":
+        return JsonWriter(path, indent=4)
+    if output_format == "json-compact":
+        return JsonWriter(path, indent=None)
+    if output_format == "msgpack":
+        return MsgpackWriter(path)
+    if output_format == "csv":
+        return CsvWriter(path)
+    if output_format == "parquet":
+        return ParquetWriter(path)
+    raise ValueError(f"Unknown output format: {output_format}")
+
+
+def read_profiles(path):
+    """Read the {roll_no: profile} mapping back from a JSON or MessagePack file.
+
+    Flattened exports (CSV/Parquet) cannot be turned back into profiles and
+    yield an empty mapping.
+    """
+    if path.endswith(FORMAT_EXTENSIONS["msgpack"]):
+        if msgpack is None:
+            return {}
+        with open(path, "rb") as f:
+            return msgpack.unpack(f, raw=False).get("Profiles", {})
+    if path.endswith(FORMAT_EXTENSIONS["json"]):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("Profiles", {})
+    return {}
+
+
+def benchmark_formats(profiles, formats=OUTPUT_FORMATS, repeat=3):
+    """Encode `profiles` with each available format; return time and size."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format in formats:
+            path = os.path.join(directory,
+                                "out" + FORMAT_EXTENSIONS[output_format])
+            timings = []
+            try:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    writer = open_writer(output_format, path)
+                    for roll_no, profile in profiles.items():
+                        writer.write(roll_no, profile)
+                    writer.close()
+                    timings.append(time.perf_counter() - start)
+            except RuntimeError as e:
+                results[output_format] = {"skipped": str(e)}
+                continue
+            results[output_format] = {
+                "seconds": min(timings),
+                "bytes": os.path.getsize(path)
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark output encoders on an existing results file.")
+    parser.add_argument("results",
+                        nargs="?",
+                        default="students_profiles.json",
+                        help="JSON or MessagePack results file")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale",
+                        type=int,
+                        default=1,
+                        help="Replicate the roster N times to size the test")
+    args = parser.parse_args()
+
+    profiles = read_profiles(args.results)
+    if args.scale > 1:
+        profiles = {
+            f"{roll_no}-{n}": profile
+            for n in range(args.scale)
+            for roll_no, profile in profiles.items()
+        }
+
+    print(f"{len(profiles)} students")
+    print(f"{'format':<14}{'seconds':>10}{'bytes':>14}")
+    for output_format, result in benchmark_formats(profiles,
+                                                   repeat=args.repeat).items():
+        if "skipped" in result:
+            print(f"{output_format:<14}{result['skipped']}")
+        else:
+            print(f"{output_format:<14}{result['seconds']:>10.4f}"
+                  f"{result['bytes']:>14}")
+
+
+if __name__ == "__main__":
+    main()
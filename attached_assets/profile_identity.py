@@ -0,0 +1,172 @@
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# Per platform: registrable domain, path segments that may precede the
+# username (and whether one is required), trailing segments that are
+# sub-pages of a profile, first path segments that are site pages rather
+# than usernames (leetcode.com/problems/, hackerrank.com/dashboard), and the
+# canonical profile URL every variant is normalised to. These rules are the
+# single definition of a profile URL; dead_profiles validates against them.
+PLATFORM_URL_RULES = {
+    "GeeksForGeeks": {
+        "domain": "geeksforgeeks.org",
+        "prefixes": ("user", "profile", "u"),
+        "prefix_required": True,
+        "suffixes": ("practice", "profile", "articles", "contributions"),
+        "reserved": ("problems", "practice", "explore", "courses", "batch",
+                     "jobs", "articles", "tag", "category", "dsa", "events"),
+        "canonical": "https://www.geeksforgeeks.org/user/{username}/",
+    },
+    "CodeChef": {
+        "domain": "codechef.com",
+        "prefixes": ("users", "u"),
+        "prefix_required": True,
+        "suffixes": ("profile", "contests", "problems"),
+        "reserved": ("problems", "practice", "contests", "learn", "ratings",
+                     "discuss", "start", "compete", "login", "signup",
+                     "settings"),
+        "canonical": "https://www.codechef.com/users/{username}",
+    },
+    "HackerRank": {
+        "domain": "hackerrank.com",
+        "prefixes": ("profile", "u", "users"),
+        "prefix_required": False,
+        "suffixes": ("profile", "badges", "certificates", "dashboard",
+                     "hackos"),
+        "reserved": ("dashboard", "domains", "challenges", "contests",
+                     "certify", "certificates", "skills-verification",
+                     "interview", "interview-preparation-kit", "rest", "auth",
+                     "login", "signup", "settings", "leaderboard", "tutorials",
+                     "products", "work", "blog", "jobs", "companies",
+                     "access-account", "logout", "community"),
+        "canonical": "https://www.hackerrank.com/profile/{username}",
+    },
+    "LeetCode": {
+        "domain": "leetcode.com",
+        "prefixes": ("u", "profile"),
+        "prefix_required": False,
+        "suffixes": ("profile", "submissions", "contests"),
+        "reserved": ("problems", "problemset", "problem-list", "contest",
+                     "contests", "discuss", "explore", "study-plan",
+                     "studyplan", "submissions", "accounts", "tag", "company",
+                     "interview", "assessment", "store", "subscribe",
+                     "support", "jobs", "list", "playground", "graphql",
+                     "api", "notifications", "progress", "premium"),
+        "canonical": "https://leetcode.com/u/{username}/",
+    },
+}
+
+
+_USERNAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class ProfileIdentity(
+        namedtuple("ProfileIdentity", "platform username canonical_url")):
+    """A profile reduced to (platform, username, canonical URL)."""
+
+    __slots__ = ()
+
+    @property
+    def key(self):
+        """Case-insensitive key for caches and indexes."""
+        return (self.platform, self.username.lower())
+
+
+def _platform_for_host(host):
+    host = host.lower().split(":")[0]
+    for platform, rules in PLATFORM_URL_RULES.items():
+        domain = rules["domain"]
+        if host == domain or host.endswith("." + domain):
+            return platform
+    return None
+
+
+@lru_cache(maxsize=65536)
+def _parse(url):
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    platform = _platform_for_host(parts.netloc)
+    if platform is None:
+        return None
+
+    rules = PLATFORM_URL_RULES[platform]
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if segments and segments[0].lower() in rules["reserved"]:
+        return None
+    if segments and segments[0].lower() in rules["prefixes"]:
+        segments = segments[1:]
+    elif rules["prefix_required"]:
+        return None
+    while len(segments) > 1 and segments[-1].lower() in rules["suffixes"]:
+        segments.pop()
+    if not segments:
+        return None
+
+    username = segments[0].lstrip("@")
+    if not _USERNAME.match(username):
+        return None
+    return ProfileIdentity(platform, username,
+                           rules["canonical"].format(username=username))
+
+
+def canonical_profile(url):
+    """Parse a profile URL into a ProfileIdentity, or None if it is not one.
+
+    Handles missing schemes, "www."/sub-domains, query strings, fragments,
+    "/u/"-style prefixes and trailing sub-pages such as "/profile".
+    Results are memoised, so every caller parses a given URL only once.
+    """
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if not url:
+        return None
+    return _parse(url)
+
+
+class ProfileResultCache:
+    """In-run cache of scraper results keyed by ProfileIdentity.key.
+
+    Concurrent requests for the same profile share one fetch: the first
+    caller fetches while the others wait for its result. Exceptions are not
+    cached. Completed results are only kept in a small LRU of `max_entries`
+    profiles, enough for duplicates that sit close together in a roster,
+    so memory stays flat however large the roster is; 0 disables retention
+    and keeps only the in-flight deduplication.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._results = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key, fetch):
+        while True:
+            with self._lock:
+                if key in self._results:
+                    self._results.move_to_end(key)
+                    return dict(self._results[key])
+                event = self._in_flight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._in_flight[key] = event
+                    break
+            event.wait()
+
+        try:
+            result = fetch()
+            if self.max_entries > 0:
+                with self._lock:
+                    self._results[key] = result
+                    while len(self._results) > self.max_entries:
+                        self._results.popitem(last=False)
+            return dict(result)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            event.set()
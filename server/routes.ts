@@ -242,11 +242,19 @@ export async function registerRoutes(app: Express): Promise<Server> {
           return res.status(500).json({ message: "Failed to scrape profiles" });
         }
 
-        const processedProfiles = Object.entries(profiles.data).map(
+        // A platform the scraper could not reach comes back either with its
+        // last known good values (imported like a fresh result) or, when it
+        // had none, as "stale—no previous value"; the stored values are then
+        // kept instead of being overwritten with zeros.
+        const hasNoPreviousValue = (entry: any) =>
+          entry?.Status === "stale—no previous value";
+
+        const processedProfiles = new Map<string, any>();
+        Object.entries(profiles.data).forEach(
           ([rollNumber, data]: [string, any]) => {
             const profileData = data.Profiles || {};
 
-            return {
+            const processed: any = {
               studentId: parseInt(rollNumber) || 0,
               hackerrank: {
                 starScore: profileData.HackerRank?.["Total_Score"] || 0,
@@ -278,17 +286,29 @@ export async function registerRoutes(app: Express): Promise<Server> {
                 score: parseInt(profileData.GeeksForGeeks?.Coding_Score) || 0,
               },
             };
+
+            if (hasNoPreviousValue(profileData.HackerRank))
+              delete processed.hackerrank;
+            if (hasNoPreviousValue(profileData.LeetCode))
+              delete processed.leetcode;
+            if (hasNoPreviousValue(profileData.CodeChef))
+              delete processed.codechef;
+            if (hasNoPreviousValue(profileData.GeeksForGeeks))
+              delete processed.gfg;
+
+            processedProfiles.set(rollNumber, processed);
           },
         );
 
-        // Create the student record with profile data
-        const processedStudents = data.map((row: any, index: number) => ({
+        // Create the student record with profile data, joined on roll number
+        // (the scraper keys its output by the trimmed roll number)
+        const processedStudents = data.map((row: any) => ({
           rollNumber: String(row["Roll Number"]),
           name: String(row["Name"]),
           branch,
           year,
           imageUrl: `https://info.aec.edu.in/AEC/StudentPhotos/${row["Roll Number"]}.jpg`,
-          profile: processedProfiles[index],
+          profile: processedProfiles.get(String(row["Roll Number"]).trim()),
         }));
 
         // Insert or update the data
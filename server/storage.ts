@@ -289,22 +289,22 @@ export class MemStorage implements IStorage {
     // Use the proper schema fields directly
     const profile: CodingProfile = {
       ...insertProfile,
-      hackerRankStarScore: insertProfile.hackerrank.starScore ?? null,
-      hackerRankContests: insertProfile.hackerrank.contests ?? null,
-      hackerRankStars: insertProfile.hackerrank.stars ?? null,
-      leetCodeEasy: insertProfile.leetcode.easy ?? null,
-      leetCodeMedium: insertProfile.leetcode.medium ?? null,
-      leetCodeHard: insertProfile.leetcode.hard ?? null,
-      leetCodeRank: insertProfile.leetcode.rank ?? null,
-      leetCodeContests: insertProfile.leetcode.contests ?? null,
-      codeChefTotalSolved: insertProfile.codechef.totalSolved ?? null,
-      codeChefContests: insertProfile.codechef.contests ?? null,
-      codeChefStars: insertProfile.codechef.stars ?? null,
-      gfgSchool: insertProfile.gfg.school ?? null,
-      gfgBasic: insertProfile.gfg.basic ?? null,
-      gfgMedium: insertProfile.gfg.medium ?? null,
-      gfgHard: insertProfile.gfg.hard ?? null,
-      gfgScore: insertProfile.gfg.score ?? null,
+      hackerRankStarScore: insertProfile.hackerrank?.starScore ?? null,
+      hackerRankContests: insertProfile.hackerrank?.contests ?? null,
+      hackerRankStars: insertProfile.hackerrank?.stars ?? null,
+      leetCodeEasy: insertProfile.leetcode?.easy ?? null,
+      leetCodeMedium: insertProfile.leetcode?.medium ?? null,
+      leetCodeHard: insertProfile.leetcode?.hard ?? null,
+      leetCodeRank: insertProfile.leetcode?.rank ?? null,
+      leetCodeContests: insertProfile.leetcode?.contests ?? null,
+      codeChefTotalSolved: insertProfile.codechef?.totalSolved ?? null,
+      codeChefContests: insertProfile.codechef?.contests ?? null,
+      codeChefStars: insertProfile.codechef?.stars ?? null,
+      gfgSchool: insertProfile.gfg?.school ?? null,
+      gfgBasic: insertProfile.gfg?.basic ?? null,
+      gfgMedium: insertProfile.gfg?.medium ?? null,
+      gfgHard: insertProfile.gfg?.hard ?? null,
+      gfgScore: insertProfile.gfg?.score ?? null,
     };
     this.codingProfiles.set(id, profile);
     return profile;